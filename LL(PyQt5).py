@@ -1,8 +1,15 @@
 import sys
+import argparse
+import json
+import math
+import queue
+import socketserver
+import threading
+from abc import ABC, abstractmethod
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QPushButton, QLineEdit, QLabel, QTextEdit, QGridLayout, QGroupBox,
+                             QPushButton, QLineEdit, QLabel, QTextEdit, QGridLayout, QGroupBox, QComboBox,
                              QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsObject)
-from PyQt5.QtCore import Qt, QPropertyAnimation, pyqtProperty, QPointF, QRectF, QParallelAnimationGroup
+from PyQt5.QtCore import Qt, QTimer, QAbstractAnimation, QPropertyAnimation, pyqtProperty, QPointF, QRectF, QParallelAnimationGroup
 from PyQt5.QtGui import QFont, QIcon, QColor, QPainter, QPen, QBrush
 
 class Node:
@@ -110,6 +117,93 @@ class LinkedList:
         return " -> ".join(map(str, elements))
 
 
+# --- Layout Engines ---
+
+class LayoutEngine(ABC):
+    """Maps a node index to the (x, y) centre of that node on the canvas.
+
+    Subclasses implement position() in O(1) so callers can ask for just the
+    slice of indices they are about to move.
+    """
+
+    def __init__(self, start_x=50, start_y=100, spacing=100):
+        self.start_x = start_x
+        self.start_y = start_y
+        self.spacing = spacing
+
+    @abstractmethod
+    def position(self, index):
+        """(x, y) centre of the node at `index`."""
+
+    def positions(self, start, stop):
+        """Lazily yield positions for indices start..stop-1."""
+        for index in range(start, stop):
+            yield self.position(index)
+
+    @abstractmethod
+    def extent(self, count):
+        """(min_x, min_y, max_x, max_y) of the first `count` node centres."""
+
+
+class RowLayout(LayoutEngine):
+    """Single horizontal row, the original layout."""
+
+    def position(self, index):
+        return (self.start_x + index * self.spacing, self.start_y)
+
+    def extent(self, count):
+        return (self.start_x, self.start_y,
+                self.start_x + max(count - 1, 0) * self.spacing, self.start_y)
+
+
+class SnakeLayout(LayoutEngine):
+    """Wraps into rows of `columns`, alternating direction so arrows stay short."""
+
+    def __init__(self, start_x=50, start_y=100, spacing=100, columns=7):
+        super().__init__(start_x, start_y, spacing)
+        self.columns = columns
+
+    def position(self, index):
+        row, col = divmod(index, self.columns)
+        if row % 2:
+            col = self.columns - 1 - col
+        return (self.start_x + col * self.spacing, self.start_y + row * self.spacing)
+
+    def extent(self, count):
+        rows = max((count + self.columns - 1) // self.columns, 1)
+        cols = max(min(count, self.columns), 1)
+        return (self.start_x, self.start_y,
+                self.start_x + (cols - 1) * self.spacing,
+                self.start_y + (rows - 1) * self.spacing)
+
+
+class SpiralLayout(LayoutEngine):
+    """Square spiral outward from (start_x, start_y), one grid step per node."""
+
+    def position(self, index):
+        # Ring k holds indices (2k-1)^2 .. (2k+1)^2 - 1, walked as four sides of 2k
+        k = (math.isqrt(index) + 1) // 2
+        if k == 0:
+            gx, gy = 0, 0
+        else:
+            side, step = divmod(index - (2 * k - 1) ** 2, 2 * k)
+            if side == 0:   # up the right edge
+                gx, gy = k, k - 1 - step
+            elif side == 1: # left along the top
+                gx, gy = k - 1 - step, -k
+            elif side == 2: # down the left edge
+                gx, gy = -k, -k + 1 + step
+            else:           # right along the bottom
+                gx, gy = -k + 1 + step, k
+        return (self.start_x + gx * self.spacing, self.start_y + gy * self.spacing)
+
+    def extent(self, count):
+        # Bounding box of the outermost (possibly partial) ring
+        k = (math.isqrt(max(count - 1, 0)) + 1) // 2
+        return (self.start_x - k * self.spacing, self.start_y - k * self.spacing,
+                self.start_x + k * self.spacing, self.start_y + k * self.spacing)
+
+
 # --- Visual Animation Classes ---
 
 class VisualNode(QGraphicsObject):
@@ -250,8 +344,66 @@ class LinkedListCanvas(QGraphicsView):
         self.start_x = 50
         self.start_y = 100
         self.node_spacing = 100
+        self.layout_engine = RowLayout(self.start_x, self.start_y, self.node_spacing)
         
-        self.scene.setSceneRect(0, 0, 800, 300)
+        self.base_rect = QRectF(0, 0, 800, 300)
+        self.scene.setSceneRect(self.base_rect)
+
+        # Running animation, and the cleanup a delete still owes once it ends
+        self.group = None
+        self.pending_delete = None
+
+    def finish_animation(self):
+        """Jump the running animation to its end and commit a pending delete.
+
+        Called before every new animation so visual_nodes matches the list
+        again; replacing self.group mid-flight would otherwise garbage-collect
+        it and its cleanup would never run.
+        """
+        if self.group is not None and self.group.state() != QAbstractAnimation.Stopped:
+            self.group.setCurrentTime(self.group.totalDuration()) # Land every node on its end value
+            self.group.stop()
+        commit, self.pending_delete = self.pending_delete, None
+        if commit:
+            commit()
+
+    def set_layout_engine(self, engine):
+        """Switch layout engine and slide every node to its new spot."""
+        self.finish_animation()
+        self.layout_engine = engine
+        self.group = QParallelAnimationGroup()
+        self.relayout(0)
+        self.fit_scene()
+        self.group.start()
+
+    def fit_scene(self):
+        """Grow the scene past the default 800x300 when the layout needs it."""
+        if not self.visual_nodes:
+            self.scene.setSceneRect(self.base_rect)
+            return
+        min_x, min_y, max_x, max_y = self.layout_engine.extent(len(self.visual_nodes))
+        margin = 75 # Node radius plus the 50px spawn offset
+        used = QRectF(min_x - margin, min_y - margin,
+                      max_x - min_x + 2 * margin, max_y - min_y + 2 * margin)
+        self.scene.setSceneRect(self.base_rect.united(used))
+
+    def relayout(self, start, offset=0):
+        """Queue moves on self.group sending node i + offset to slot i, for slots from `start`.
+
+        Only that suffix is touched; nodes already in place get no animation.
+        Delete uses offset=1 to pull the nodes after the dying one back a slot.
+        """
+        stop = len(self.visual_nodes) - offset
+        for i, (x, y) in enumerate(self.layout_engine.positions(start, stop), start):
+            vnode = self.visual_nodes[i + offset]
+            target = QPointF(x, y)
+            if vnode.pos() == target:
+                continue
+            anim = QPropertyAnimation(vnode, b"pos")
+            anim.setDuration(500)
+            anim.setStartValue(vnode.pos())
+            anim.setEndValue(target)
+            self.group.addAnimation(anim)
 
     def create_arrow(self, start, end):
         arrow = ArrowItem(start, end)
@@ -261,10 +413,27 @@ class LinkedListCanvas(QGraphicsView):
         self.arrows.append(arrow)
         return arrow
 
+    def remove_arrow(self, arrow):
+        arrow.start_item.remove_arrow(arrow)
+        arrow.end_item.remove_arrow(arrow)
+        self.scene.removeItem(arrow)
+        self.arrows.remove(arrow)
+
+    def find_arrow(self, start, end):
+        for arrow in start.arrows:
+            if arrow.start_item is start and arrow.end_item is end:
+                return arrow
+        return None
+
     def clear_scene(self):
+        # Drop any in-flight animation; its nodes are about to be deleted
+        if self.group is not None:
+            self.group.stop()
+        self.pending_delete = None
         self.scene.clear()
         self.visual_nodes = []
         self.arrows = []
+        self.scene.setSceneRect(self.base_rect)
 
     def sync_from_list(self, linked_list):
         """Ideally we animate nicely, but for bulk updates (reverse), logic sync is good."""
@@ -274,7 +443,8 @@ class LinkedListCanvas(QGraphicsView):
         prev_vnode = None
         
         while temp:
-            vnode = VisualNode(temp.data, self.start_x + idx * self.node_spacing, self.start_y)
+            x, y = self.layout_engine.position(idx)
+            vnode = VisualNode(temp.data, x, y)
             self.scene.addItem(vnode)
             self.visual_nodes.append(vnode)
             
@@ -285,24 +455,37 @@ class LinkedListCanvas(QGraphicsView):
             temp = temp.next
             idx += 1
 
-    def animate_append(self, data):
-        # Create new node at a spawn position (faded out) then move to place
-        target_idx = len(self.visual_nodes)
-        target_x = self.start_x + target_idx * self.node_spacing
-        target_y = self.start_y
+        self.fit_scene()
+
+    def animate_insert(self, index, data):
+        # Create new node at a spawn position (faded out) then move to place,
+        # while everything after it slides to its new slot
+        self.finish_animation()
+        index = max(0, min(index, len(self.visual_nodes)))
+        target_x, target_y = self.layout_engine.position(index)
         
         # Spawn slightly above
         new_node = VisualNode(data, target_x, target_y - 50)
         new_node.opacity = 0.0
         self.scene.addItem(new_node)
-        self.visual_nodes.append(new_node)
+        self.visual_nodes.insert(index, new_node)
         
-        # Add arrow if there's a predecessor
-        if len(self.visual_nodes) > 1:
-            prev_node = self.visual_nodes[-2]
+        # Rewire arrows: prev -> next becomes prev -> new -> next
+        prev_node = self.visual_nodes[index - 1] if index > 0 else None
+        next_node = self.visual_nodes[index + 1] if index + 1 < len(self.visual_nodes) else None
+        if prev_node and next_node:
+            old_arrow = self.find_arrow(prev_node, next_node)
+            if old_arrow:
+                self.remove_arrow(old_arrow)
+        if prev_node:
             self.create_arrow(prev_node, new_node)
+        if next_node:
+            self.create_arrow(new_node, next_node)
             
         # Animation
+        self.group = QParallelAnimationGroup()
+        self.relayout(index + 1)
+        
         anim_pos = QPropertyAnimation(new_node, b"pos")
         anim_pos.setDuration(500)
         anim_pos.setStartValue(QPointF(target_x, target_y - 50))
@@ -313,49 +496,19 @@ class LinkedListCanvas(QGraphicsView):
         anim_op.setStartValue(0.0)
         anim_op.setEndValue(1.0)
         
-        self.group = QParallelAnimationGroup()
         self.group.addAnimation(anim_pos)
         self.group.addAnimation(anim_op)
+        self.fit_scene()
         self.group.start()
 
-    def animate_prepend(self, data):
-        # Shift all existing nodes right
-        self.group = QParallelAnimationGroup()
-        
-        for vnode in self.visual_nodes:
-            anim = QPropertyAnimation(vnode, b"pos")
-            anim.setDuration(500)
-            anim.setStartValue(vnode.pos())
-            anim.setEndValue(vnode.pos() + QPointF(self.node_spacing, 0))
-            self.group.addAnimation(anim)
-            
-        # Create new node
-        new_node = VisualNode(data, self.start_x, self.start_y - 50)
-        new_node.opacity = 0.0
-        self.scene.addItem(new_node)
-        self.visual_nodes.insert(0, new_node)
-        
-        anim_new_pos = QPropertyAnimation(new_node, b"pos")
-        anim_new_pos.setDuration(500)
-        anim_new_pos.setStartValue(QPointF(self.start_x, self.start_y - 50))
-        anim_new_pos.setEndValue(QPointF(self.start_x, self.start_y))
-        
-        anim_new_op = QPropertyAnimation(new_node, b"opacity")
-        anim_new_op.setDuration(500)
-        anim_new_op.setStartValue(0.0)
-        anim_new_op.setEndValue(1.0)
-        
-        self.group.addAnimation(anim_new_pos)
-        self.group.addAnimation(anim_new_op)
-        
-        # New arrow: new_node -> old_head
-        if len(self.visual_nodes) > 1:
-            arrow = self.create_arrow(self.visual_nodes[0], self.visual_nodes[1])
-            self.arrows.insert(0, arrow)
+    def animate_append(self, data):
+        self.animate_insert(len(self.visual_nodes), data)
 
-        self.group.start()
+    def animate_prepend(self, data):
+        self.animate_insert(0, data)
 
     def animate_delete(self, index):
+        self.finish_animation()
         if index < 0 or index >= len(self.visual_nodes):
             return
             
@@ -370,43 +523,228 @@ class LinkedListCanvas(QGraphicsView):
         anim_op.setEndValue(0.0)
         self.group.addAnimation(anim_op)
         
-        # Shift subsequent nodes left
-        for i in range(index + 1, len(self.visual_nodes)):
-            vnode = self.visual_nodes[i]
-            anim = QPropertyAnimation(vnode, b"pos")
-            anim.setDuration(500)
-            anim.setStartValue(vnode.pos())
-            anim.setEndValue(vnode.pos() - QPointF(self.node_spacing, 0))
-            self.group.addAnimation(anim)
+        # Slide subsequent nodes back one slot
+        self.relayout(index, offset=1)
             
         def on_finished():
-            # Remove target arrow connections?
-            # When we rebuild or specific removal, we need to be careful.
+            # The node may already be gone if the scene was cleared meanwhile
+            if target_node not in self.visual_nodes:
+                return
+            idx = self.visual_nodes.index(target_node)
+            prev_node = self.visual_nodes[idx - 1] if idx > 0 else None
+            next_node = self.visual_nodes[idx + 1] if idx + 1 < len(self.visual_nodes) else None
             
+            for arrow in list(target_node.arrows):
+                self.remove_arrow(arrow)
             self.scene.removeItem(target_node)
-            del self.visual_nodes[index]
-            
-            # Rebuild arrows to be safe/clean
-            for arrow in self.arrows:
-                self.scene.removeItem(arrow)
-            self.arrows = []
+            del self.visual_nodes[idx]
             
-            for i in range(len(self.visual_nodes) - 1):
-                self.create_arrow(self.visual_nodes[i], self.visual_nodes[i+1])
+            if prev_node and next_node:
+                self.create_arrow(prev_node, next_node)
+            self.fit_scene()
                 
-        self.group.finished.connect(on_finished)
+        self.pending_delete = on_finished
+        self.group.finished.connect(self.finish_animation)
         self.group.start()
 
+# --- Remote Control ---
+
+# op name -> number of integer arguments it takes
+CONTROL_COMMANDS = {
+    'append': 1,
+    'prepend': 1,
+    'delete': 1,
+    'insert': 2, # data, key
+    'reverse': 0,
+    'clear': 0,
+}
+
+
+def parse_commands(line):
+    """Parse one protocol line into a list of (op, args) tuples.
+
+    A line is either plain text ("append 5", "insert 7 3") or JSON: a single
+    object like {"op": "insert", "data": 7, "key": 3} or a list of them for a batch.
+    Raises ValueError on anything malformed.
+    """
+    line = line.strip()
+    if not line:
+        return []
+
+    if line[0] in '[{':
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"bad JSON: {e.msg}")
+        if isinstance(payload, dict):
+            payload = [payload]
+        if not isinstance(payload, list):
+            raise ValueError("expected a JSON object or list")
+
+        raw = []
+        for item in payload:
+            if not isinstance(item, dict):
+                raise ValueError("batch entries must be objects")
+            op = item.get('op')
+            if not isinstance(op, str):
+                raise ValueError("op must be a string")
+            args = [item[k] for k in ('data', 'key') if k in item]
+            # JSON must carry real integers: no bools, floats or numeric strings
+            if not all(type(a) is int for a in args):
+                raise ValueError(f"{op} arguments must be integers")
+            raw.append((op, args))
+    else:
+        parts = line.split()
+        raw = [(parts[0], parts[1:])]
+
+    commands = []
+    for op, args in raw:
+        if op not in CONTROL_COMMANDS:
+            raise ValueError(f"unknown op {op!r}")
+        if len(args) != CONTROL_COMMANDS[op]:
+            raise ValueError(f"{op} takes {CONTROL_COMMANDS[op]} argument(s)")
+        try:
+            args = tuple(int(a) for a in args)
+        except (TypeError, ValueError):
+            raise ValueError(f"{op} arguments must be integers")
+        commands.append((op, args))
+    return commands
+
+
+def apply_command(linked_list, op, args):
+    """Run a parsed command against the list and return a log message."""
+    if op == 'append':
+        linked_list.append(args[0])
+        return f"Appended {args[0]}"
+    if op == 'prepend':
+        linked_list.prepend(args[0])
+        return f"Prepended {args[0]}"
+    if op == 'delete':
+        if not linked_list.search(args[0]):
+            return f"Node {args[0]} not found for deletion."
+        linked_list.delete_node(args[0])
+        return f"Deleted {args[0]}"
+    if op == 'insert':
+        data, key = args
+        if not linked_list.search(key):
+            return f"Key {key} not found."
+        linked_list.insertion(data, key)
+        return f"Inserted {data} after {key}"
+    if op == 'reverse':
+        linked_list.reverse()
+        return "List reversed!"
+    if op == 'clear':
+        linked_list.head = None
+        return "List cleared!"
+    raise ValueError(f"unknown op {op!r}")
+
+
+class ControlServer:
+    """Local line-protocol server that feeds list operations to the GUI.
+
+    Connections are handled on worker threads. Each parsed line (a single
+    command or a whole JSON batch) goes into a bounded queue as one item, so
+    a batch is always applied in the same frame. When `max_pending` lines
+    are waiting the reader blocks, so a fast client stalls on its socket
+    instead of piling up work. Lines longer than `max_line` bytes and batches
+    of more than `max_batch` commands are refused. Each line is answered with
+    "ok <n>" once its commands are queued, or "error <reason>".
+    """
+
+    def __init__(self, max_pending=256, max_line=64 * 1024, max_batch=500):
+        self.commands = queue.Queue(maxsize=max_pending)
+        self.max_line = max_line
+        self.max_batch = max_batch
+        self.carry = [] # A line pending() took but could not fit in the last frame
+        self.server = None
+        self.thread = None
+
+    def handle_stream(self, rfile, wfile):
+        """Serve one client over a pair of binary file objects until EOF.
+
+        Works on anything file-like, e.g. both ends of socket.socketpair(),
+        so it can be exercised without opening a port.
+        """
+        while True:
+            raw = rfile.readline(self.max_line + 1)
+            if not raw:
+                break
+            try:
+                if len(raw) > self.max_line:
+                    # Throw away the rest of the oversized line
+                    while raw and not raw.endswith(b'\n'):
+                        raw = rfile.readline(self.max_line + 1)
+                    raise ValueError(f"line longer than {self.max_line} bytes")
+                commands = parse_commands(raw.decode('utf-8'))
+                if len(commands) > self.max_batch:
+                    raise ValueError(f"batch larger than {self.max_batch} commands")
+            except (UnicodeDecodeError, ValueError) as e:
+                wfile.write(f"error {e}\n".encode('utf-8'))
+            else:
+                if commands:
+                    self.commands.put(commands) # Blocks while the GUI catches up
+                wfile.write(f"ok {len(commands)}\n".encode('utf-8'))
+            wfile.flush()
+
+    def pending(self, limit=None):
+        """Pop queued commands without blocking, as one flat list.
+
+        Returns at most `limit` commands (or one whole line if that line alone
+        is bigger). Lines are never split: one that would overflow the limit
+        is kept back for the next call. Only the GUI thread should call this.
+        """
+        batch, self.carry = self.carry, []
+        while limit is None or len(batch) < limit:
+            try:
+                line = self.commands.get_nowait()
+            except queue.Empty:
+                break
+            if batch and limit is not None and len(batch) + len(line) > limit:
+                self.carry = line
+                break
+            batch.extend(line)
+        return batch
+
+    def start(self, host='127.0.0.1', port=0):
+        control = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                control.handle_stream(self.rfile, self.wfile)
+
+        self.server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.server.server_address
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+            self.thread = None
+
 # --- Main GUI ---
 
 class LinkedListGUI(QMainWindow):
-    def __init__(self, linked_list):
+    FRAME_MS = 16 # ~60 fps
+    MAX_COMMANDS_PER_FRAME = 500
+
+    def __init__(self, linked_list, control_server=None):
         super().__init__()
         self.mylist = linked_list
+        self.control_server = control_server
         self.initUI()
         self.apply_styles()
         # Initialize canvas with current list state (empty)
         self.canvas.sync_from_list(self.mylist)
+
+        # Remote commands are drained once per frame so a burst costs one redraw
+        if self.control_server:
+            self.control_timer = QTimer(self)
+            self.control_timer.timeout.connect(self.process_control_commands)
+            self.control_timer.start(self.FRAME_MS)
     
     def initUI(self):
         self.setWindowTitle('Linked List Visualizer')
@@ -461,6 +799,20 @@ class LinkedListGUI(QMainWindow):
         key_h_layout.addWidget(self.key_field)
         input_layout.addLayout(key_h_layout)
         
+        # Layout selection
+        layout_h_layout = QHBoxLayout()
+        layout_label = QLabel("Layout:")
+        layout_label.setFont(QFont('Arial', 11, QFont.Bold))
+        layout_label.setMinimumWidth(80)
+        self.layout_combo = QComboBox()
+        self.layout_combo.addItems(['Row', 'Snake', 'Spiral'])
+        self.layout_combo.setMinimumHeight(35)
+        self.layout_combo.setFont(QFont('Arial', 11))
+        self.layout_combo.currentTextChanged.connect(self.change_layout)
+        layout_h_layout.addWidget(layout_label)
+        layout_h_layout.addWidget(self.layout_combo)
+        input_layout.addLayout(layout_h_layout)
+        
         input_group.setLayout(input_layout)
         main_layout.addWidget(input_group)
         
@@ -643,9 +995,7 @@ class LinkedListGUI(QMainWindow):
             
             if index != -1:
                 self.mylist.insertion(data, key)
-                # For now, just sync full list for insertion as it is complex to animate "insert in middle" right now
-                # Or wait, let's keep it simple: sync
-                self.canvas.sync_from_list(self.mylist)
+                self.canvas.animate_insert(index + 1, data) # Animation
                 self.update_output(f"Inserted {data} after {key}")
             else:
                 self.update_output(f"Key {key} not found.")
@@ -669,6 +1019,35 @@ class LinkedListGUI(QMainWindow):
         self.canvas.clear_scene()
         self.update_output("List cleared!")
     
+    def change_layout(self, name):
+        c = self.canvas
+        if name == 'Snake':
+            layout = SnakeLayout(c.start_x, c.start_y, c.node_spacing)
+        elif name == 'Spiral':
+            # Centre of the default scene
+            layout = SpiralLayout(c.base_rect.center().x(), c.base_rect.center().y(), c.node_spacing)
+        else:
+            layout = RowLayout(c.start_x, c.start_y, c.node_spacing)
+        c.set_layout_engine(layout)
+        self.update_output(f"Layout: {name}")
+
+    def process_control_commands(self):
+        commands = self.control_server.pending(self.MAX_COMMANDS_PER_FRAME)
+        if not commands:
+            return
+
+        messages = [apply_command(self.mylist, op, args) for op, args in commands]
+        self.canvas.sync_from_list(self.mylist)
+        if len(messages) == 1:
+            self.update_output(f"Remote: {messages[0]}")
+        else:
+            self.update_output(f"Remote: {len(messages)} commands, last: {messages[-1]}")
+
+    def closeEvent(self, event):
+        if self.control_server:
+            self.control_server.stop()
+        super().closeEvent(event)
+
     def update_output(self, message):
         pass # Disabling text log spam for now or keep it minimal
         current = self.output.toPlainText()
@@ -687,7 +1066,21 @@ mylist = LinkedList()
 
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    gui = LinkedListGUI(mylist)
+    # Optional: --control-port N starts the local control server;
+    # anything else is left for Qt
+    parser = argparse.ArgumentParser(description='Linked List Visualizer')
+    parser.add_argument('--control-port', type=int, metavar='PORT',
+                        help='listen for list commands on 127.0.0.1:PORT (0 picks a free port)')
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
+
+    control_server = None
+    if args.control_port is not None:
+        control_server = ControlServer(max_batch=LinkedListGUI.MAX_COMMANDS_PER_FRAME)
+        host, port = control_server.start(port=args.control_port)
+        print(f"Control server listening on {host}:{port}")
+
+    gui = LinkedListGUI(mylist, control_server)
     gui.show()
     sys.exit(app.exec_())
@@ -0,0 +1,167 @@
+"""Tests for the remote control protocol.
+
+The app is a single script that imports PyQt5 at the top, so these tests
+need PyQt5 installed (pip install PyQt5); without it the module is skipped
+and `pytest -rs` shows why. No display or network is needed.
+"""
+import importlib.util
+import pathlib
+import select
+import socket
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5", reason="the visualizer script imports PyQt5; pip install PyQt5 to run these tests")
+
+# The app lives in a single script whose name is not a valid module name
+_path = pathlib.Path(__file__).resolve().parent.parent / "LL(PyQt5).py"
+_spec = importlib.util.spec_from_file_location("ll_visualizer", _path)
+ll = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ll)
+
+
+@pytest.fixture
+def client():
+    """Yield a factory for (server, sock, stream), with handle_stream serving the
+    other end of a socketpair."""
+    def connect(**kwargs):
+        server = ll.ControlServer(**kwargs)
+        ours, theirs = socket.socketpair()
+        thread = threading.Thread(
+            target=server.handle_stream,
+            args=(theirs.makefile('rb'), theirs.makefile('wb')),
+            daemon=True,
+        )
+        thread.start()
+        sockets.extend([ours, theirs])
+        return server, ours, ours.makefile('rwb')
+
+    sockets = []
+    yield connect
+    for sock in sockets:
+        sock.close()
+
+
+def send(stream, line):
+    stream.write(line.encode('utf-8') + b'\n')
+    stream.flush()
+
+
+def test_parse_plain_text():
+    assert ll.parse_commands("append 5") == [('append', (5,))]
+    assert ll.parse_commands("insert 7 3\n") == [('insert', (7, 3))]
+    assert ll.parse_commands("reverse") == [('reverse', ())]
+    assert ll.parse_commands("   ") == []
+
+
+def test_parse_json_object_and_batch():
+    assert ll.parse_commands('{"op": "insert", "data": 7, "key": 3}') == [('insert', (7, 3))]
+    assert ll.parse_commands('[{"op": "append", "data": 1}, {"op": "clear"}]') == [
+        ('append', (1,)),
+        ('clear', ()),
+    ]
+
+
+@pytest.mark.parametrize("line", [
+    "bogus 1",
+    "append",
+    "append x",
+    "insert 1",
+    '{"op": "append"',
+    '{"op": "append", "data": true}',
+    '{"op": "append", "data": 3.9}',
+    '{"op": "append", "data": "5"}',
+    '[1, 2]',
+    '{"op": ["a"]}',
+    '{"op": {}}',
+])
+def test_parse_rejects_bad_input(line):
+    with pytest.raises(ValueError):
+        ll.parse_commands(line)
+
+
+def test_apply_command():
+    linked_list = ll.LinkedList()
+    assert ll.apply_command(linked_list, 'append', (1,)) == "Appended 1"
+    ll.apply_command(linked_list, 'append', (2,))
+    ll.apply_command(linked_list, 'prepend', (0,))
+    assert ll.apply_command(linked_list, 'insert', (5, 1)) == "Inserted 5 after 1"
+    assert ll.apply_command(linked_list, 'insert', (5, 9)) == "Key 9 not found."
+    assert str(linked_list) == "0 -> 1 -> 5 -> 2"
+
+    assert ll.apply_command(linked_list, 'delete', (9,)) == "Node 9 not found for deletion."
+    ll.apply_command(linked_list, 'delete', (5,))
+    ll.apply_command(linked_list, 'reverse', ())
+    assert str(linked_list) == "2 -> 1 -> 0"
+
+    ll.apply_command(linked_list, 'clear', ())
+    assert linked_list.head is None
+
+
+def test_stream_replies(client):
+    server, _, stream = client()
+    send(stream, "append 1")
+    assert stream.readline() == b"ok 1\n"
+    send(stream, '[{"op": "append", "data": 2}, {"op": "prepend", "data": 0}]')
+    assert stream.readline() == b"ok 2\n"
+    send(stream, "bogus")
+    assert stream.readline().startswith(b"error unknown op")
+
+    assert server.pending() == [('append', (1,)), ('append', (2,)), ('prepend', (0,))]
+    assert server.pending() == []
+
+
+def test_unhashable_op_gets_error_reply(client):
+    server, _, stream = client()
+    send(stream, '{"op": ["a"]}')
+    assert stream.readline() == b"error op must be a string\n"
+    # The connection is still served afterwards
+    send(stream, "append 1")
+    assert stream.readline() == b"ok 1\n"
+
+
+def test_long_line_rejected(client):
+    server, _, stream = client(max_line=32)
+    send(stream, "append " + "1" * 100)
+    assert stream.readline() == b"error line longer than 32 bytes\n"
+    send(stream, "append 2")
+    assert stream.readline() == b"ok 1\n"
+    assert server.pending() == [('append', (2,))]
+
+
+def test_large_batch_rejected(client):
+    server, _, stream = client(max_batch=2)
+    send(stream, '[{"op": "append", "data": 1}, {"op": "append", "data": 2}, {"op": "append", "data": 3}]')
+    assert stream.readline() == b"error batch larger than 2 commands\n"
+    assert server.pending() == []
+
+
+def test_backpressure_blocks_until_drained(client):
+    server, sock, stream = client(max_pending=1)
+    send(stream, "append 1")
+    assert stream.readline() == b"ok 1\n"
+
+    # The queue is full, so the batch is not acknowledged yet
+    send(stream, '[{"op": "append", "data": 2}, {"op": "append", "data": 3}]')
+    readable, _, _ = select.select([sock], [], [], 0.2)
+    assert readable == []
+
+    assert server.pending() == [('append', (1,))]
+    assert stream.readline() == b"ok 2\n"
+    assert server.pending() == [('append', (2,)), ('append', (3,))]
+
+
+def test_pending_respects_limit_without_splitting(client):
+    server, _, stream = client()
+    send(stream, "append 1")
+    send(stream, '[{"op": "append", "data": 2}, {"op": "append", "data": 3}]')
+    send(stream, "append 4")
+    for _ in range(3):
+        assert stream.readline().startswith(b"ok")
+
+    # The batch would overflow the limit, so it waits for the next frame whole
+    assert server.pending(limit=2) == [('append', (1,))]
+    assert server.pending(limit=2) == [('append', (2,)), ('append', (3,))]
+    assert server.pending(limit=2) == [('append', (4,))]
+    assert server.pending(limit=2) == []
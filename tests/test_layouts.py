@@ -0,0 +1,86 @@
+"""Tests for the canvas layout engines.
+
+Like test_control_server.py these load the visualizer script, so they need
+PyQt5 installed; without it the module is skipped.
+"""
+import importlib.util
+import pathlib
+
+import pytest
+
+pytest.importorskip("PyQt5", reason="the visualizer script imports PyQt5; pip install PyQt5 to run these tests")
+
+# The app lives in a single script whose name is not a valid module name
+_path = pathlib.Path(__file__).resolve().parent.parent / "LL(PyQt5).py"
+_spec = importlib.util.spec_from_file_location("ll_visualizer", _path)
+ll = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ll)
+
+
+def layouts():
+    return [
+        ll.RowLayout(50, 100, 100),
+        ll.SnakeLayout(50, 100, 100, columns=4),
+        ll.SpiralLayout(400, 150, 100),
+    ]
+
+
+def test_row_positions():
+    layout = ll.RowLayout(50, 100, 100)
+    assert [layout.position(i) for i in range(3)] == [(50, 100), (150, 100), (250, 100)]
+
+
+def test_snake_turns_at_column_multiples():
+    layout = ll.SnakeLayout(0, 0, 10, columns=3)
+    assert [layout.position(i) for i in range(9)] == [
+        (0, 0), (10, 0), (20, 0),    # left to right
+        (20, 10), (10, 10), (0, 10), # right to left
+        (0, 20), (10, 20), (20, 20), # left to right again
+    ]
+
+
+def test_spiral_first_rings():
+    layout = ll.SpiralLayout(0, 0, 1)
+    assert [layout.position(i) for i in range(10)] == [
+        (0, 0),
+        (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1),
+        (2, 1),
+    ]
+
+
+@pytest.mark.parametrize("layout", layouts(), ids=lambda l: type(l).__name__)
+def test_positions_unique_and_one_step_apart(layout):
+    points = [layout.position(i) for i in range(50)]
+    assert len(set(points)) == len(points)
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == layout.spacing
+
+
+@pytest.mark.parametrize("layout", layouts(), ids=lambda l: type(l).__name__)
+@pytest.mark.parametrize("start, stop", [(0, 0), (0, 10), (7, 26), (24, 25)])
+def test_positions_matches_position(layout, start, stop):
+    assert list(layout.positions(start, stop)) == [layout.position(i) for i in range(start, stop)]
+
+
+@pytest.mark.parametrize("layout", layouts(), ids=lambda l: type(l).__name__)
+def test_extent_of_empty_and_single(layout):
+    x, y = layout.position(0)
+    assert layout.extent(0) == (x, y, x, y)
+    assert layout.extent(1) == (x, y, x, y)
+
+
+@pytest.mark.parametrize("layout", layouts(), ids=lambda l: type(l).__name__)
+def test_extent_covers_every_node(layout):
+    for count in range(1, 50):
+        min_x, min_y, max_x, max_y = layout.extent(count)
+        for x, y in layout.positions(0, count):
+            assert min_x <= x <= max_x and min_y <= y <= max_y
+
+
+def test_layout_engine_requires_both_methods():
+    class PositionOnly(ll.LayoutEngine):
+        def position(self, index):
+            return (0, 0)
+
+    with pytest.raises(TypeError):
+        PositionOnly()